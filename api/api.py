@@ -1,16 +1,22 @@
 import binascii
 import hashlib
 import os
-from datetime import datetime, timedelta
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from api.devices import HomgarHome, MODEL_CODE_MAPPING, HomgarHubDevice, TemperatureAirSensor
 from api.logutil import TRACE, get_logger, logging
+from api.wire import DeviceWire, decode_response
 
 logger = get_logger(__file__)
 
+_BASE_HEADERS = {"lang": "en", "appCode": "1"}
+
 
 class HomgarApiException(Exception):
     def __init__(self, code, msg):
@@ -31,7 +37,8 @@ class HomgarApi:
             self,
             auth_cache: Optional[dict] = None,
             api_base_url: str = "https://region3.homgarus.com",
-            requests_session: requests.Session = None
+            requests_session: requests.Session = None,
+            pool_maxsize: int = 16
     ):
         """
         Create an object for interacting with the Homgar API
@@ -40,9 +47,26 @@ class HomgarApi:
             if a valid token is still present.
         :param api_base_url: The base URL for the Homgar API. Omit trailing slash.
         :param requests_session: Optional requests lib session to use. New session is created if omitted.
+        :param pool_maxsize: Maximum number of pooled keep-alive connections for the session created when
+            requests_session is omitted.
         """
-        self.session = requests_session or requests.Session()
+        if requests_session is None:
+            requests_session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=pool_maxsize,
+                max_retries=Retry(total=2, backoff_factor=0.2)
+            )
+            requests_session.mount("https://", adapter)
+            requests_session.headers.update({"Connection": "keep-alive", **_BASE_HEADERS})
+            # Base headers are sent by the session itself
+            self._request_headers = {}
+        else:
+            # Leave a caller-supplied session untouched; send base headers per request instead
+            self._request_headers = _BASE_HEADERS
+        self.session = requests_session
         self.cache = auth_cache or {}
+        self._pw_md5 = None  # (password, md5 hex digest) of the last login
         self.base = api_base_url
         logger.info("Initialized HomgarApi with base URL: %s", self.base)
 
@@ -55,32 +79,39 @@ class HomgarApi:
         :param headers: Optional additional headers.
         """
         logger.log(TRACE, "%s %s %s", method, url, kwargs)
-        headers = {"lang": "en", "appCode": "1", **(headers or {})}
         if with_auth:
-            headers["auth"] = self.cache["token"]
-        response = self.session.request(method, url, headers=headers, **kwargs)
-        logger.log(TRACE, "-[%03d]-> %s", response.status_code, response.text)
+            kwargs["headers"] = {**self._request_headers, **(headers or {}), "auth": self.cache["token"]}
+        elif headers or self._request_headers:
+            kwargs["headers"] = {**self._request_headers, **(headers or {})}
+        response = self.session.request(method, url, **kwargs)
+        if logger.isEnabledFor(TRACE):
+            logger.log(TRACE, "-[%03d]-> %s", response.status_code, response.text)
         return response
 
-    def _request_json(self, method, path, **kwargs):
+    def _request_json(self, method, path, data_type=None, **kwargs):
         """
         Make a HTTP request expecting a JSON response and log the outcome.
         :param method: HTTP method (GET, POST, etc.)
         :param path: The API path to request.
+        :param data_type: Optional type from api.wire to decode the response data into.
+            The data is returned as decoded JSON if omitted.
         """
-        response = self._request(method, self.base + path, **kwargs).json()
-        code = response.get('code')
+        raw = self._request(method, self.base + path, **kwargs).content
+        try:
+            code, msg, data = decode_response(raw, data_type)
+        except ValueError as e:
+            raise HomgarApiException(None, f"Malformed response for {path}: {e}") from e
         if code != 0:
-            logger.error("API returned error code %d with message: %s", code, response.get('msg'))
-            raise HomgarApiException(code, response.get('msg'))
-        return response.get('data')
+            logger.error("API returned error code %s with message: %s", code, msg)
+            raise HomgarApiException(code, msg)
+        return data
 
     def _get_json(self, path, **kwargs):
         """
         Perform a GET request expecting a JSON response.
         :param path: The API path to request.
         """
-        logger.info("GET request for path: %s", path)
+        logger.log(TRACE, "GET request for path: %s", path)
         return self._request_json("GET", path, **kwargs)
 
     def _post_json(self, path, body, **kwargs):
@@ -89,7 +120,7 @@ class HomgarApi:
         :param path: The API path to request.
         :param body: The JSON body to send in the POST request.
         """
-        logger.info("POST request for path: %s with body: %s", path, body)
+        logger.log(TRACE, "POST request for path: %s with body: %s", path, body)
         return self._request_json("POST", path, json=body, **kwargs)
 
     def login(self, email: str, password: str, area_code="31") -> None:
@@ -100,15 +131,23 @@ class HomgarApi:
         :param area_code: Phone country code associated with the account.
         """
         logger.info("Attempting to login with email: %s", email)
+        if self._pw_md5 is None or self._pw_md5[0] != password:
+            self._pw_md5 = password, hashlib.md5(password.encode('utf-8')).hexdigest()
+        password_hash = self._pw_md5[1]
+        device_id = self.cache.get('device_id')
+        if device_id is None:
+            device_id = self.cache['device_id'] = binascii.b2a_hex(os.urandom(16)).decode('utf-8')
         data = self._post_json("/auth/basic/app/login", {
             "areaCode": area_code,
             "phoneOrEmail": email,
-            "password": hashlib.md5(password.encode('utf-8')).hexdigest(),
-            "deviceId": binascii.b2a_hex(os.urandom(16)).decode('utf-8')
+            "password": password_hash,
+            "deviceId": device_id
         }, with_auth=False)
         self.cache['email'] = email
         self.cache['token'] = data.get('token')
-        self.cache['token_expires'] = datetime.utcnow().timestamp() + data.get('tokenExpired')
+        # Caches from older versions hold a utcnow()-based 'token_expires' instead; those count as expired
+        self.cache.pop('token_expires', None)
+        self.cache['token_expires_epoch'] = time.time() + data.get('tokenExpired')
         self.cache['refresh_token'] = data.get('refreshToken')
         logger.info("Login successful, token cached")
 
@@ -131,33 +170,33 @@ class HomgarApi:
         :return: List of hubs with associated subdevices.
         """
         logger.info("Fetching devices for home ID: %s", hid)
-        data = self._get_json("/app/device/getDeviceByHid", params={"hid": str(hid)})
+        data = self._get_json("/app/device/getDeviceByHid", params={"hid": str(hid)}, data_type=List[DeviceWire])
         hubs = []
 
-        def device_base_props(dev_data):
+        def device_base_props(dev: DeviceWire):
             return dict(
-                model=dev_data.get('model'),
-                model_code=dev_data.get('modelCode'),
-                name=dev_data.get('name'),
-                did=dev_data.get('did'),
-                mid=dev_data.get('mid'),
-                address=dev_data.get('addr'),
-                port_number=dev_data.get('portNumber'),
-                alerts=dev_data.get('alerts'),
+                model=dev.model,
+                model_code=dev.modelCode,
+                name=dev.name,
+                did=dev.did,
+                mid=dev.mid,
+                address=dev.addr,
+                port_number=dev.portNumber,
+                alerts=dev.alerts,
             )
 
-        def get_device_class(dev_data):
-            model_code = dev_data.get('modelCode')
-            if model_code not in MODEL_CODE_MAPPING:
-                logger.warning("Unknown device '%s' with modelCode %d", dev_data.get('model'), model_code)
-                return None
-            return MODEL_CODE_MAPPING[model_code]
+        model_code_mapping_get = MODEL_CODE_MAPPING.get
+
+        def get_device_class(dev: DeviceWire):
+            device_class = model_code_mapping_get(dev.modelCode)
+            if device_class is None:
+                logger.warning("Unknown device '%s' with modelCode %d", dev.model, dev.modelCode)
+            return device_class
 
         for hub_data in data:
             subdevices = []
-            for subdevice_data in hub_data.get('subDevices', []):
-                did = subdevice_data.get('did')
-                if did == 1:
+            for subdevice_data in hub_data.subDevices:
+                if subdevice_data.did == 1:
                     # Skip hub itself
                     continue
                 subdevice_class = get_device_class(subdevice_data)
@@ -184,7 +223,33 @@ class HomgarApi:
         """
         logger.info("Fetching device status for hub ID: %s", hub.mid)
         data = self._get_json("/app/device/getDeviceStatus", params={"mid": str(hub.mid)})
-        id_map = {status_id: device for device in [hub, *hub.subdevices] for status_id in device.get_device_status_ids()}
+        self._apply_device_status(hub, data)
+
+    def get_device_status_bulk(self, hubs: List[HomgarHubDevice], max_workers: int = 8) -> None:
+        """
+        Updates the device status of all given hubs and their subdevices, fetching the statuses concurrently.
+        Requests share the connection pool of the session; the statuses are applied in the calling thread.
+        :param hubs: The hubs to update.
+        :param max_workers: Maximum number of concurrent requests.
+        """
+        if not hubs:
+            return
+        logger.info("Fetching device status for %d hubs", len(hubs))
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(hubs))) as executor:
+            futures = [
+                executor.submit(self._get_json, "/app/device/getDeviceStatus", params={"mid": str(hub.mid)})
+                for hub in hubs
+            ]
+            for hub, future in zip(hubs, futures):
+                self._apply_device_status(hub, future.result())
+
+    def _apply_device_status(self, hub: HomgarHubDevice, data: dict) -> None:
+        """
+        Applies a /app/device/getDeviceStatus response to the given hub and its subdevices.
+        :param hub: The hub the response belongs to.
+        :param data: The $.data part of the API response.
+        """
+        id_map = hub.status_id_map
 
         for subdevice_status in data['subDeviceStatus']:
             device = id_map.get(subdevice_status['id'])
@@ -200,12 +265,12 @@ class HomgarApi:
         :param password: Account password.
         :param area_code: Phone country code associated with the account.
         """
-        logger.info("Ensuring login status for email: %s", email)
+        logger.debug("Ensuring login status for email: %s", email)
         if (
                 self.cache.get('email') != email or
-                datetime.fromtimestamp(self.cache.get('token_expires', 0)) - datetime.utcnow() < timedelta(minutes=60)
+                self.cache.get('token_expires_epoch', 0) - time.time() < 60 * 60
         ):
             logger.info("Token expired or email mismatch, logging in again")
             self.login(email, password, area_code=area_code)
         else:
-            logger.info("Already logged in with valid credentials")
\ No newline at end of file
+            logger.debug("Already logged in with valid credentials")
\ No newline at end of file
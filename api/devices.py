@@ -1,5 +1,5 @@
 import re
-from typing import List
+from typing import Dict, List
 
 STATS_VALUE_REGEX = re.compile(r'^(-?\d+)\((-?\d+)/(-?\d+)/(-?\d+)\)$')
 
@@ -108,8 +108,36 @@ class HomgarHubDevice(HomgarDevice):
     def __init__(self, subdevices, **kwargs):
         super().__init__(**kwargs)
         self.address = 1
+        self._status_id_map = None
         self.subdevices = subdevices
 
+    @property
+    def subdevices(self) -> List['HomgarSubDevice']:
+        return self._subdevices
+
+    @subdevices.setter
+    def subdevices(self, subdevices: List['HomgarSubDevice']) -> None:
+        self._subdevices = subdevices
+        self._status_id_map = None
+
+    @property
+    def status_id_map(self) -> Dict[str, HomgarDevice]:
+        """
+        Maps every subDeviceStatus ID returned by get_device_status_ids() of this hub and its subdevices to the
+        device listening to it. Built on first use and reset when subdevices is reassigned; call
+        invalidate_status_id_map() after mutating the subdevices list in place.
+        """
+        if self._status_id_map is None:
+            self._status_id_map = {
+                status_id: device
+                for device in [self, *self._subdevices]
+                for status_id in device.get_device_status_ids()
+            }
+        return self._status_id_map
+
+    def invalidate_status_id_map(self) -> None:
+        self._status_id_map = None
+
     def __str__(self):
         return f"{super().__str__()} with {len(self.subdevices)} subdevices"
 
@@ -1,7 +1,7 @@
 from enum import IntEnum
 from datetime import datetime
-import struct
-from typing import List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 class DpStatusCode(IntEnum):
     CHG = 0
@@ -54,6 +54,8 @@ class DpStatusCode(IntEnum):
     STA_RSSI2 = 51
 
 class RecDeviceDpModel:
+    __slots__ = ('dp_code', 'dp_id', 'dp_port', 'dp_type')
+
     def __init__(self, dp_code, dp_id, dp_port, dp_type):
         self.dp_code = dp_code
         self.dp_id = dp_id
@@ -74,6 +76,7 @@ class RecDeviceDpModel:
         return hash((self.dp_code, self.dp_id, self.dp_port, self.dp_type))
 
 class T4Date:
+    __slots__ = ('second', 'minute', 'hour', 'date', 'month', 'year')
 
     @staticmethod
     def get_t4_date_by_param(timestamp):
@@ -113,8 +116,7 @@ class T4Date:
                 self.year == other.year)
     
     def __hash__(self):
-        return (self.second * 31 + 
-                self.minute) * 31 + self.hour * 31 + self.date * 31 + self.month * 31 + self.year
+        return hash((self.second, self.minute, self.hour, self.date, self.month, self.year))
     
     def get_timestamp(self):
         dt = datetime(self.year, self.month, self.date, 
@@ -126,7 +128,8 @@ class T4Date:
         return int(dt.timestamp() * 1000)
     
 class DpDeviceStatus:
-    
+    __slots__ = ('dp_id', 'type_code', 'type_len', 'type_value')
+
     def __init__(self, dp_id=0, type_code=-1, type_len=0, type_value=None):
         self.dp_id = dp_id
         self.type_code = type_code
@@ -141,27 +144,22 @@ class DpDeviceStatus:
         comma_pos = hex_str.find(',')
         if comma_pos != -1:
             hex_str = hex_str[:comma_pos]
-        length = len(hex_str) // 2
-        byte_array = bytearray(length)
-        for i in range(length):
-            pos = i * 2
-            substring = hex_str[pos:pos+2]
-            byte_array[i] = int(substring, 16) & 0xFF
+        # Any trailing odd nibble is ignored
+        byte_array = bytes.fromhex(hex_str[:len(hex_str) // 2 * 2])
+        length = len(byte_array)
         i = 0
         while i < length:
             dp_status = DpDeviceStatus()
             
             if has_dp_id:
-                buffer = bytearray(8)
-                buffer[0] = byte_array[i]
-                dp_status.dp_id = int.from_bytes(buffer, byteorder='little')
+                dp_status.dp_id = byte_array[i]
                 i += 1
             
             b = byte_array[i]
             if ((b >> 7) & 1) == 0:
                 dp_status.type_code = (b >> 4) & 7
                 dp_status.type_len = 1
-                dp_status.type_value = bytes([b])
+                dp_status.type_value = byte_array[i:i+1]
                 i += 1
             else:
                 type_code_part = (b >> 2) & 31
@@ -204,12 +202,58 @@ class DpDeviceStatus:
         return (f"DpDeviceStatus(dp_id={self.dp_id}, type_code={self.type_code}, "
                 f"type_len={self.type_len}, type_value={self.type_value})")
     
-class NotImplementedError(Exception):
-    pass
+@lru_cache(maxsize=256)
+def _parse_dp_status(status: str) -> Tuple[bool, Dict[Tuple[int, int], DpDeviceStatus]]:
+    """
+    Strips the version prefix from a DP status string and parses it once for all DevicePanel getters.
+    :return: Whether the status carries DP IDs, and its entries keyed by (type_code, dp_id). Only the first entry
+        for each key is kept. Unversioned entries all have dp_id 0.
+    """
+    is_versioned = True
+    status_param = status
+    if "#" in status_param:
+        substring = status_param[1:2]
+        status_param = status_param[3:]
+        is_versioned = substring == "1"
+
+    parsed_status = {}
+    for device_status in DpDeviceStatus.analyze_dp_device_status(status_param, is_versioned):
+        parsed_status.setdefault((device_status.type_code, device_status.dp_id), device_status)
+    return is_versioned, parsed_status
 
 
 class DevicePanel:
+    _MODEL_CACHE: Dict[int, Optional[List[RecDeviceDpModel]]] = {}
+    _MODEL_INDEX: Dict[int, Optional[Dict[Tuple[int, int], RecDeviceDpModel]]] = {}
+
     def get_model(self, model_code: int) -> Optional[List[RecDeviceDpModel]]:
+        try:
+            return self._MODEL_CACHE[model_code]
+        except KeyError:
+            models = self._MODEL_CACHE[model_code] = self._build_model(model_code)
+            return models
+
+    def _get_model_index(self, model_code: int) -> Optional[Dict[Tuple[int, int], RecDeviceDpModel]]:
+        """
+        Index of the DP models (dp_type 1) for the given model code, keyed by (dp_code, dp_port).
+        A dp_port of 0 is stored as port 1, matching the lookup in get_dp_device_status().
+        """
+        try:
+            return self._MODEL_INDEX[model_code]
+        except KeyError:
+            model_list = self.get_model(model_code)
+            index = None
+            if model_list is not None:
+                index = {}
+                for device_dp_model in model_list:
+                    if device_dp_model.dp_type == 1:
+                        dp_port = device_dp_model.dp_port if device_dp_model.dp_port != 0 else 1
+                        index.setdefault((device_dp_model.dp_code, dp_port), device_dp_model)
+            self._MODEL_INDEX[model_code] = index
+            return index
+
+    @staticmethod
+    def _build_model(model_code: int) -> Optional[List[RecDeviceDpModel]]:
         if model_code == 271:
             models = []
             models.append(RecDeviceDpModel(DpStatusCode.RSSI.value, 23, 0, 1))
@@ -230,7 +274,8 @@ class DevicePanel:
         return None
 
     def is_dp_status(self, status: str) -> bool:
-        return status.find("#") == 2
+        # Same as status.find("#") == 2 without scanning the whole string
+        return status[2:3] == "#" and "#" not in status[:2]
 
     def is_return_default(self, model: int, status: str) -> bool:
         if model != 0:
@@ -250,7 +295,7 @@ class DevicePanel:
                     return False
                 return (type_value[0] & 1) == 1
             else:
-                raise NotImplementedError()
+                return False
         except Exception:
             return False
 
@@ -267,7 +312,7 @@ class DevicePanel:
                     return False
                 return ((type_value[0] >> 1) & 1) == 1
             else:
-                raise NotImplementedError()
+                return False
         except Exception:
             return False
 
@@ -276,15 +321,14 @@ class DevicePanel:
             return 0
         try:
             if not self.is_dp_status(status):
-                raise NotImplementedError()
+                return 0
             dp_device_status = self.get_dp_device_status(model, status, DpStatusCode.BAT, 0)
             if dp_device_status is None or dp_device_status.type_value is None:
                 return 0
             type_value = dp_device_status.type_value
             if len(type_value) < 2:
                 return 0
-            # Convert byte to int using struct
-            return struct.unpack('<Q', type_value[1:2] + b'\x00' * 7)[0]
+            return type_value[1]
         except Exception:
             return 0
 
@@ -292,19 +336,8 @@ class DevicePanel:
         if self.is_return_default(model, status):
             return 0
         try:
-            if not (pcode == 1 or pcode == 3):
-                if not self.is_dp_status(status):
-                    raise NotImplementedError()
-                dp_device_status = self.get_dp_device_status(model, status, DpStatusCode.RSSI, 0)
-                if dp_device_status is None or dp_device_status.type_value is None:
-                    return 0
-                type_value = dp_device_status.type_value
-                if len(type_value) < 2:
-                    return 0
-                return type_value[1]
-            
             if not self.is_dp_status(status):
-                raise NotImplementedError()
+                return 0
             dp_device_status = self.get_dp_device_status(model, status, DpStatusCode.RSSI, 0)
             if dp_device_status is None or dp_device_status.type_value is None:
                 return 0
@@ -328,7 +361,7 @@ class DevicePanel:
                     return 0
                 return type_value[1] & 15
             else:
-                raise NotImplementedError()
+                return 0
         except Exception:
             return 0
 
@@ -340,12 +373,9 @@ class DevicePanel:
                     if dp_device_status is not None and dp_device_status.type_value is not None and dp_device_status.type_len > 0:
                         type_len = dp_device_status.type_len
                         type_value = dp_device_status.type_value
-                        bytes_array = type_value[1:1+type_len]
-                        # Extend to at least 8 bytes for struct unpacking
-                        padded_bytes = bytes_array + b'\x00' * (max(type_len, 8) - len(bytes_array))
-                        return struct.unpack('<Q', padded_bytes[:8])[0]
+                        return int.from_bytes(type_value[1:1+type_len], 'little')
                 else:
-                    raise NotImplementedError()
+                    return -1
             except Exception:
                 pass
         return -1
@@ -355,16 +385,13 @@ class DevicePanel:
             return 0
         try:
             if not self.is_dp_status(status):
-                raise NotImplementedError()
+                return 0
             dp_device_status = self.get_dp_device_status(model, status, DpStatusCode.DURATION, port)
             if dp_device_status is None or dp_device_status.type_value is None or dp_device_status.type_len <= 0:
                 return 0
             type_len = dp_device_status.type_len
             type_value = dp_device_status.type_value
-            bytes_array = type_value[1:1+type_len]
-            # Extend to at least 8 bytes for struct unpacking
-            padded_bytes = bytes_array + b'\x00' * (max(type_len, 8) - len(bytes_array))
-            return struct.unpack('<Q', padded_bytes[:8])[0]
+            return int.from_bytes(type_value[1:1+type_len], 'little')
         except Exception:
             return 0
 
@@ -377,15 +404,12 @@ class DevicePanel:
                         if dp_device_status is not None and dp_device_status.type_value is not None:
                             type_value = dp_device_status.type_value
                             if len(type_value) >= 5:
-                                bytes_array = type_value[1:5]
-                                # Extend to 8 bytes for struct unpacking
-                                padded_bytes = bytes_array + b'\x00' * 4
-                                time_value = struct.unpack('<Q', padded_bytes)[0]
+                                time_value = int.from_bytes(type_value[1:5], 'little')
                                 t4_date = T4Date.get_t4_date_by_param(time_value)
                                 time_stamp = t4_date.get_timestamp() - timestamp
                                 return time_stamp
                 else:
-                    raise NotImplementedError()
+                    return -1
             except Exception:
                 pass
         return -1
@@ -398,50 +422,22 @@ class DevicePanel:
                     if dp_device_status is not None and dp_device_status.type_value is not None:
                         type_value = dp_device_status.type_value
                         if len(type_value) >= 5:
-                            bytes_array = type_value[1:5]
-                            # Extend to 8 bytes for struct unpacking
-                            padded_bytes = bytes_array + b'\x00' * 4
-                            time_value = struct.unpack('<Q', padded_bytes)[0]
+                            time_value = int.from_bytes(type_value[1:5], 'little')
                             return T4Date.get_t4_date_by_param(time_value)
                 else:
-                    raise NotImplementedError()
+                    return T4Date()
             except Exception:
                 pass
         return T4Date()
 
     def get_dp_device_status(self, model: int, status: str, dp_status_code: DpStatusCode, port: int) -> Optional[DpDeviceStatus]:
-        is_versioned = True
         if port == 0:
             port = 1
         
-        rec_device_dp_model = None
-        model_list = self.get_model(model)
-        
-        if model_list is not None:
-            for device_dp_model in model_list:
-                rec_device_dp_model = device_dp_model
-                dp_port = rec_device_dp_model.dp_port if rec_device_dp_model.dp_port != 0 else 1
-                if (rec_device_dp_model.dp_type == 1 and 
-                    rec_device_dp_model.dp_code == dp_status_code.value and
-                    dp_port == port):
-                    break
-        
+        model_index = self._get_model_index(model)
+        rec_device_dp_model = model_index.get((dp_status_code.value, port)) if model_index else None
         if rec_device_dp_model is None:
             return None
         
-        status_param = status
-        if "#" in status_param:
-            substring = status_param[1:2]
-            status_param = status_param[3:]
-            is_versioned = substring == "1"
-        
-        for device_status in DpDeviceStatus.analyze_dp_device_status(status_param, is_versioned):
-            if is_versioned:
-                if (device_status.type_code == dp_status_code.value and 
-                    device_status.dp_id == rec_device_dp_model.dp_id):
-                    return device_status
-            else:
-                if device_status.type_code == dp_status_code.value:
-                    return device_status
-        
-        return None
\ No newline at end of file
+        is_versioned, parsed_status = _parse_dp_status(status)
+        return parsed_status.get((dp_status_code.value, rec_device_dp_model.dp_id if is_versioned else 0))
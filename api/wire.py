@@ -0,0 +1,120 @@
+"""
+Typed models of HomGar API payloads.
+
+When msgspec is installed, responses are decoded straight into these structs. Otherwise, plain classes with the
+same attributes are built from the decoded JSON dicts. Either way, decode_response() returns the same types.
+Only the data of a successful response is validated, and only when a data_type is requested.
+"""
+
+from typing import Any, List, Optional, Tuple, get_args, get_origin
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+    try:
+        import orjson
+    except ImportError:
+        import json as orjson
+
+
+if msgspec is not None:
+    class _ApiResponse(msgspec.Struct):
+        """
+        The envelope around every API response. The data is decoded separately, once the code shows success.
+        Code and message are taken as-is, like the JSON fallback does.
+        """
+        code: Any = None
+        msg: Any = None
+        data: msgspec.Raw = msgspec.Raw(b'null')
+
+    class DeviceWire(msgspec.Struct):
+        """
+        A hub or subdevice as returned by /app/device/getDeviceByHid.
+        """
+        model: Optional[str] = None
+        modelCode: Optional[int] = None
+        name: Optional[str] = None
+        did: Optional[int] = None
+        mid: Optional[int] = None
+        addr: Optional[int] = None
+        portNumber: Optional[int] = None
+        alerts: Any = None
+        subDevices: List['DeviceWire'] = []
+
+    def decode_response(raw: bytes, data_type=None) -> Tuple[Any, Any, Any]:
+        """
+        Decodes an API response.
+        :param raw: The response body.
+        :param data_type: Optional type from this module to decode the data into. Plain JSON values if omitted.
+        :return: Code, message and data of the response. The data is only decoded if the code is 0.
+        :raises ValueError: If the body or the data does not match the expected shape.
+        """
+        response = msgspec.json.decode(raw, type=_ApiResponse, strict=False)
+        if response.code != 0:
+            return response.code, response.msg, None
+        if data_type is None:
+            return response.code, response.msg, msgspec.json.decode(response.data)
+        return response.code, response.msg, msgspec.json.decode(response.data, type=data_type, strict=False)
+
+else:
+    def _as_int(value):
+        """
+        Accepts the same values as msgspec's non-strict int decoding: ints, integral floats and numeric strings.
+        """
+        if value is None or type(value) is int:
+            return value
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+        if isinstance(value, str):
+            return int(value)
+        raise ValueError(f"Expected int, got {value!r}")
+
+    class DeviceWire:
+        """
+        A hub or subdevice as returned by /app/device/getDeviceByHid.
+        """
+        __slots__ = ('model', 'modelCode', 'name', 'did', 'mid', 'addr', 'portNumber', 'alerts', 'subDevices')
+
+        @classmethod
+        def from_dict(cls, dev_data: dict) -> 'DeviceWire':
+            if not isinstance(dev_data, dict):
+                raise ValueError(f"Expected object, got {dev_data!r}")
+            dev = cls()
+            dev.model = dev_data.get('model')
+            dev.modelCode = _as_int(dev_data.get('modelCode'))
+            dev.name = dev_data.get('name')
+            dev.did = _as_int(dev_data.get('did'))
+            dev.mid = _as_int(dev_data.get('mid'))
+            dev.addr = _as_int(dev_data.get('addr'))
+            dev.portNumber = _as_int(dev_data.get('portNumber'))
+            dev.alerts = dev_data.get('alerts')
+            dev.subDevices = _convert(dev_data.get('subDevices', []), List[DeviceWire])
+            return dev
+
+    def _convert(data, data_type):
+        if get_origin(data_type) is list:
+            if not isinstance(data, list):
+                raise ValueError(f"Expected array, got {data!r}")
+            item_type, = get_args(data_type)
+            return [_convert(item, item_type) for item in data]
+        return data_type.from_dict(data)
+
+    def decode_response(raw: bytes, data_type=None) -> Tuple[Any, Any, Any]:
+        """
+        Decodes an API response.
+        :param raw: The response body.
+        :param data_type: Optional type from this module to decode the data into. Plain JSON values if omitted.
+        :return: Code, message and data of the response. The data is only decoded if the code is 0.
+        :raises ValueError: If the body or the data does not match the expected shape.
+        """
+        response = orjson.loads(raw)
+        if not isinstance(response, dict):
+            raise ValueError(f"Expected object, got {response!r}")
+        code, msg, data = response.get('code'), response.get('msg'), response.get('data')
+        if code != 0:
+            return code, msg, None
+        if data_type is None:
+            return code, msg, data
+        return code, msg, _convert(data, data_type)
@@ -17,9 +17,10 @@ def demo(api: HomgarApi, config):
     for home in api.get_homes():
         print(f"({home.hid}) {home.name}:")
 
-        for hub in api.get_devices_for_hid(home.hid):
+        hubs = api.get_devices_for_hid(home.hid)
+        api.get_device_status_bulk(hubs)
+        for hub in hubs:
             print(f"  - {hub}")
-            api.get_device_status(hub)
             for subdevice in hub.subdevices:
                 print(f"    + {subdevice}")
 